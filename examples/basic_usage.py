@@ -55,7 +55,7 @@ def main():
     print("OVERALL SHOE SUMMARY")
     print("="*80)
     shoe_summary = analyzer.get_shoe_summary(gear_info)
-    print(shoe_summary.to_string(index=False))
+    print(shoe_summary.to_string(index=False, float_format='{:.2f}'.format))
     
     # Generate weekly report (last 4 weeks)
     print("\n" + "="*80)
@@ -63,7 +63,7 @@ def main():
     print("="*80)
     weekly_report = analyzer.get_weekly_report(gear_info).head(4)
     if not weekly_report.empty:
-        print(weekly_report.to_string(index=False))
+        print(weekly_report.to_string(index=False, float_format='{:.2f}'.format))
     else:
         print("No weekly data available")
     
@@ -73,7 +73,7 @@ def main():
     print("="*80)
     monthly_report = analyzer.get_monthly_report(gear_info)
     if not monthly_report.empty:
-        print(monthly_report.to_string(index=False))
+        print(monthly_report.to_string(index=False, float_format='{:.2f}'.format))
     else:
         print("No monthly data available")
     
@@ -83,7 +83,7 @@ def main():
     print("="*80)
     yearly_report = analyzer.get_yearly_report(gear_info)
     if not yearly_report.empty:
-        print(yearly_report.to_string(index=False))
+        print(yearly_report.to_string(index=False, float_format='{:.2f}'.format))
     else:
         print("No yearly data available")
     
@@ -97,7 +97,7 @@ def main():
         print("="*80)
         shoe_activities = analyzer.get_activities_by_shoe(first_gear_id).head(5)
         if not shoe_activities.empty:
-            print(shoe_activities.to_string(index=False))
+            print(shoe_activities.to_string(index=False, float_format='{:.2f}'.format))
         else:
             print("No activities found for this shoe")
     
@@ -1,55 +1,263 @@
 """Data analyzer for processing Strava activities and generating reports."""
 
+import functools
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Union
 from collections import defaultdict
+from types import SimpleNamespace
+import numpy as np
 import pandas as pd
+from cachetools import LRUCache
 from stravalib.strava_model import SummaryActivity, DetailedActivity
 
 
+# Per-activity columns, in order, before the calendar columns are derived
+ACTIVITY_COLUMNS = [
+    'id', 'name', 'type', 'date', 'distance_km', 'moving_time_hours',
+    'elapsed_time_hours', 'elevation_gain_m', 'gear_id',
+]
+
+
+def _format_week(key: int) -> str:
+    """Format an integer year-week key (e.g. 202405) as '2024-W05'."""
+    return f'{key // 100}-W{key % 100:02d}'
+
+
+def _format_month(key: int) -> str:
+    """Format an integer year-month key (e.g. 202405) as '2024-05'."""
+    return f'{key // 100}-{key % 100:02d}'
+
+
+_PERIOD_FORMATTERS = {
+    'year_week': _format_week,
+    'year_month': _format_month,
+}
+
+
+def _build_dataframe(activities: List[Union[SummaryActivity, DetailedActivity]]) -> pd.DataFrame:
+    """Convert activities to a pandas DataFrame with typed columns and calendar keys."""
+    n = len(activities)
+    ids = np.empty(n, dtype=np.int64)
+    names = np.empty(n, dtype=object)
+    types = np.empty(n, dtype=object)
+    dates = np.empty(n, dtype=object)
+    distance = np.empty(n, dtype=np.float64)
+    moving = np.empty(n, dtype=np.float64)
+    elapsed = np.empty(n, dtype=np.float64)
+    elevation = np.empty(n, dtype=np.float64)
+    gear_ids = np.empty(n, dtype=object)
+    
+    # Fill one typed column per field in a single pass instead of building
+    # a dict per activity and letting pandas infer dtypes afterwards.
+    # Missing values are stored as NaN and zeroed once after the loop.
+    # In stravalib v2, moving_time and elapsed_time are int (seconds) instead of timedelta
+    nan = np.nan
+    for i, activity in enumerate(activities):
+        ids[i] = activity.id
+        names[i] = activity.name
+        types[i] = str(activity.type) if activity.type else 'Unknown'
+        dates[i] = activity.start_date_local
+        distance[i] = activity.distance or nan
+        moving[i] = activity.moving_time or nan
+        elapsed[i] = activity.elapsed_time or nan
+        elevation[i] = activity.total_elevation_gain or nan
+        gear_ids[i] = getattr(activity, 'gear_id', None) or None
+    
+    df = pd.DataFrame({
+        'id': ids,
+        'name': names,
+        'type': types,
+        'date': dates,
+        'distance_km': np.where(np.isnan(distance), 0.0, distance / 1000),
+        'moving_time_hours': np.where(np.isnan(moving), 0.0, moving / 3600),
+        'elapsed_time_hours': np.where(np.isnan(elapsed), 0.0, elapsed / 3600),
+        'elevation_gain_m': np.where(np.isnan(elevation), 0.0, elevation),
+        'gear_id': gear_ids,
+    }, columns=ACTIVITY_COLUMNS, copy=False)
+    
+    df['date'] = pd.to_datetime(df['date'])
+    
+    # Derive every calendar field from one DatetimeIndex, once each
+    dates = pd.DatetimeIndex(df['date'])
+    year = dates.year.to_numpy(np.int32)
+    month = dates.month.to_numpy(np.int32)
+    iso = dates.isocalendar()
+    iso_year = iso['year'].to_numpy(np.int32)
+    iso_week = iso['week'].to_numpy(np.int32)
+    df['year'] = year
+    df['month'] = month
+    df['week'] = iso_week
+    # Periods are integer keys such as 202405; they are only formatted
+    # as labels once per unique period when a report is built
+    df['year_week'] = iso_year * 100 + iso_week
+    df['year_month'] = year * 100 + month
+    
+    # Narrower integer dtypes for the ID and calendar columns; the measures stay
+    # float64, since float32 values carry noise (135.3 -> 135.3000030518) into the sums
+    for col in ('id', 'year', 'month', 'week'):
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    
+    # Group keys are low-cardinality; categorical codes make groupby cheaper
+    for col in ('gear_id', 'type', 'year', 'year_week', 'year_month'):
+        df[col] = df[col].astype('category')
+    
+    return df
+
+
+# Correctly typed template for analyzers without activities; only ever copied
+_EMPTY_DF = _build_dataframe([])
+
+
+def _memoize_report(method):
+    """
+    Cache a report method's result on the analyzer, keyed by the gear names.
+    
+    The cached result is returned as is, so callers must not modify it in place.
+    """
+    @functools.wraps(method)
+    def wrapper(self, gear_info: Optional[Dict[str, str]] = None):
+        key = (method.__name__, tuple(sorted(gear_info.items())) if gear_info else None)
+        try:
+            return self._report_cache[key]
+        except KeyError:
+            pass
+        result = method(self, gear_info)
+        self._report_cache[key] = result
+        return result
+    return wrapper
+
+
 class ActivityAnalyzer:
     """Analyzes Strava activities and generates shoe-based reports."""
     
-    def __init__(self, activities: List[Union[SummaryActivity, DetailedActivity]]):
+    def __init__(self, activities: List[Union[SummaryActivity, DetailedActivity]],
+                 engine: Optional[str] = None):
         """
         Initialize the analyzer with activities.
         
         Args:
-            activities: List of SummaryActivity or DetailedActivity objects
+            activities: List of SummaryActivity or DetailedActivity objects, or
+                the lighter ActivityRecord objects from get_activities_fast
+            engine: pandas aggregation engine, e.g. 'numba' (requires numba),
+                or None for the default cython kernels
         """
         self.activities = activities
-        self.df = self._activities_to_dataframe()
+        self.engine = engine
+        self._report_cache = LRUCache(maxsize=32)
+    
+    @functools.cached_property
+    def df(self) -> pd.DataFrame:
+        """Per-activity DataFrame, built on first use."""
+        return self._activities_to_dataframe()
+    
+    @classmethod
+    def warm_up(cls, engine: Optional[str] = None) -> None:
+        """
+        Build all reports once for a dummy activity.
+        
+        With engine='numba' this compiles the aggregation kernels up front so
+        the first real report doesn't pay the JIT compilation cost.
+        
+        Args:
+            engine: pandas aggregation engine to warm up
+        """
+        dummy = SimpleNamespace(
+            id=0, name='warm-up', type='Run', start_date_local=datetime(2024, 1, 1),
+            distance=1000.0, moving_time=600, elapsed_time=600,
+            total_elevation_gain=0.0, gear_id='g0',
+        )
+        cls([dummy], engine=engine)._all_reports()
     
     def _activities_to_dataframe(self) -> pd.DataFrame:
         """Convert activities to a pandas DataFrame for easier analysis."""
-        data = []
+        if not self.activities:
+            # A copy, so modifying one analyzer's frame can't leak into the others
+            return _EMPTY_DF.copy()
+        return _build_dataframe(self.activities)
+    
+    def _totals(self, keys: List[str]) -> pd.DataFrame:
+        """Sum distance, moving time and elevation and count activities per group."""
+        # Only rolled up further, so the group order doesn't matter here
+        grouped = self.df.groupby(keys, observed=True, sort=False)
+        totals = grouped[['distance_km', 'moving_time_hours', 'elevation_gain_m']].sum(engine=self.engine)
+        totals['activity_count'] = grouped.size()
+        return totals.reset_index()
+    
+    @staticmethod
+    def _rollup(totals: pd.DataFrame, keys: List[str], labels: List[str], prefix: str = '') -> pd.DataFrame:
+        """
+        Re-aggregate already computed totals to a coarser grouping.
         
-        for activity in self.activities:
-            # Extract relevant fields
-            # In stravalib v2, moving_time and elapsed_time are int (seconds) instead of timedelta
-            record = {
-                'id': activity.id,
-                'name': activity.name,
-                'type': str(activity.type) if activity.type else 'Unknown',
-                'date': activity.start_date_local,
-                'distance_km': float(activity.distance) / 1000 if activity.distance else 0.0,
-                'moving_time_hours': float(activity.moving_time) / 3600 if activity.moving_time else 0.0,
-                'elapsed_time_hours': float(activity.elapsed_time) / 3600 if activity.elapsed_time else 0.0,
-                'elevation_gain_m': float(activity.total_elevation_gain) if activity.total_elevation_gain else 0.0,
-                'gear_id': activity.gear_id if hasattr(activity, 'gear_id') and activity.gear_id else None,
-            }
-            data.append(record)
+        Named aggregation produces the report's column names directly and the
+        group keys are reset under the report's labels, so no renaming is needed.
+        """
+        return totals.groupby(keys, observed=True).agg(**{
+            f'{prefix}distance_km': ('distance_km', 'sum'),
+            f'{prefix}moving_time_hours': ('moving_time_hours', 'sum'),
+            f'{prefix}elevation_gain_m': ('elevation_gain_m', 'sum'),
+            'activity_count': ('activity_count', 'sum'),
+        }).reset_index(names=labels)
+    
+    @staticmethod
+    def _attach_shoe_name(report: pd.DataFrame, gear_info: Optional[Dict[str, str]]) -> pd.DataFrame:
+        """Insert a shoe_name column before gear_id."""
+        # Resolve a name once per gear category and gather by category code;
+        # the trailing entry is picked up by code -1 (no gear_id)
+        categories = report['gear_id'].cat.categories
+        if gear_info:
+            names = [gear_info.get(gear_id) or 'Unknown Shoe' for gear_id in categories] + ['Unknown Shoe']
+        else:
+            names = [f'Shoe {gear_id}' for gear_id in categories] + ['No Shoe']
+        name_lut = np.array(names, dtype=object)
+        report.insert(report.columns.get_loc('gear_id'), 'shoe_name',
+                      name_lut[report['gear_id'].cat.codes.to_numpy()])
+        return report
+    
+    def _shoe_summary(self, totals: pd.DataFrame, gear_info: Optional[Dict[str, str]]) -> pd.DataFrame:
+        """Roll totals up per shoe into the overall shoe summary."""
+        summary = self._rollup(totals, ['gear_id'], ['gear_id'], prefix='total_')
+        return self._attach_shoe_name(summary, gear_info)
+    
+    def _period_report(self, totals: pd.DataFrame, key: str, label: str,
+                       gear_info: Optional[Dict[str, str]]) -> pd.DataFrame:
+        """Roll totals up per period and shoe into a report, most recent period first."""
+        report = self._attach_shoe_name(self._rollup(totals, [key, 'gear_id'], [label, 'gear_id']), gear_info)
+        if key in _PERIOD_FORMATTERS:
+            report[label] = report[label].cat.rename_categories(_PERIOD_FORMATTERS[key])
         
-        df = pd.DataFrame(data)
-        if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
-            df['year'] = df['date'].dt.year
-            df['month'] = df['date'].dt.month
-            df['week'] = df['date'].dt.isocalendar().week
-            df['year_week'] = df['date'].dt.strftime('%Y-W%U')
-            df['year_month'] = df['date'].dt.strftime('%Y-%m')
+        # groupby already sorted the periods ascending; reversing avoids a re-sort
+        return report.iloc[::-1]
+    
+    def get_all_reports(self, gear_info: Optional[Dict[str, str]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Get the shoe summary and the weekly, monthly and yearly reports at once.
+        
+        The activities are aggregated in a single pass at the finest granularity
+        and the much smaller result is rolled up into each report. The reports
+        are cached per gear_info and the single report methods are served from
+        the same cache, so asking one analyzer for several reports only
+        aggregates the activities once. Every call returns fresh copies, which
+        callers may modify freely.
+        
+        Args:
+            gear_info: Dictionary mapping gear_id to gear name
+            
+        Returns:
+            Dictionary with 'shoe_summary', 'weekly', 'monthly' and 'yearly' DataFrames
+        """
+        return {name: report.copy() for name, report in self._all_reports(gear_info).items()}
+    
+    @_memoize_report
+    def _all_reports(self, gear_info: Optional[Dict[str, str]] = None) -> Dict[str, pd.DataFrame]:
+        """Build all reports; cached, so the result must not be modified."""
+        totals = self._totals(['year_week', 'year_month', 'year', 'gear_id'])
         
-        return df
+        return {
+            'shoe_summary': self._shoe_summary(totals, gear_info),
+            'weekly': self._period_report(totals, 'year_week', 'week', gear_info),
+            'monthly': self._period_report(totals, 'year_month', 'month', gear_info),
+            'yearly': self._period_report(totals, 'year', 'year', gear_info),
+        }
     
     def get_shoe_summary(self, gear_info: Optional[Dict[str, str]] = None) -> pd.DataFrame:
         """
@@ -61,38 +269,7 @@ class ActivityAnalyzer:
         Returns:
             DataFrame with shoe summaries
         """
-        if self.df.empty:
-            return pd.DataFrame()
-        
-        # Group by gear_id
-        summary = self.df.groupby('gear_id').agg({
-            'distance_km': 'sum',
-            'moving_time_hours': 'sum',
-            'elapsed_time_hours': 'sum',
-            'elevation_gain_m': 'sum',
-            'id': 'count'
-        }).reset_index()
-        
-        summary.columns = ['gear_id', 'total_distance_km', 'total_moving_time_hours', 
-                          'total_elapsed_time_hours', 'total_elevation_gain_m', 'activity_count']
-        
-        # Add gear names if provided
-        if gear_info:
-            summary['shoe_name'] = summary['gear_id'].map(gear_info)
-            summary['shoe_name'] = summary['shoe_name'].fillna('Unknown Shoe')
-        else:
-            summary['shoe_name'] = summary['gear_id'].apply(
-                lambda x: f'Shoe {x}' if x else 'No Shoe'
-            )
-        
-        # Round values for readability
-        summary['total_distance_km'] = summary['total_distance_km'].round(2)
-        summary['total_moving_time_hours'] = summary['total_moving_time_hours'].round(2)
-        summary['total_elapsed_time_hours'] = summary['total_elapsed_time_hours'].round(2)
-        summary['total_elevation_gain_m'] = summary['total_elevation_gain_m'].round(2)
-        
-        return summary[['shoe_name', 'gear_id', 'total_distance_km', 'total_moving_time_hours', 
-                       'total_elevation_gain_m', 'activity_count']]
+        return self._all_reports(gear_info)['shoe_summary'].copy()
     
     def get_weekly_report(self, gear_info: Optional[Dict[str, str]] = None) -> pd.DataFrame:
         """
@@ -104,35 +281,7 @@ class ActivityAnalyzer:
         Returns:
             DataFrame with weekly shoe statistics
         """
-        if self.df.empty:
-            return pd.DataFrame()
-        
-        weekly = self.df.groupby(['year_week', 'gear_id']).agg({
-            'distance_km': 'sum',
-            'moving_time_hours': 'sum',
-            'elevation_gain_m': 'sum',
-            'id': 'count'
-        }).reset_index()
-        
-        weekly.columns = ['week', 'gear_id', 'distance_km', 'moving_time_hours', 
-                         'elevation_gain_m', 'activity_count']
-        
-        # Add gear names if provided
-        if gear_info:
-            weekly['shoe_name'] = weekly['gear_id'].map(gear_info)
-            weekly['shoe_name'] = weekly['shoe_name'].fillna('Unknown Shoe')
-        else:
-            weekly['shoe_name'] = weekly['gear_id'].apply(
-                lambda x: f'Shoe {x}' if x else 'No Shoe'
-            )
-        
-        # Round values
-        weekly['distance_km'] = weekly['distance_km'].round(2)
-        weekly['moving_time_hours'] = weekly['moving_time_hours'].round(2)
-        weekly['elevation_gain_m'] = weekly['elevation_gain_m'].round(2)
-        
-        return weekly[['week', 'shoe_name', 'gear_id', 'distance_km', 
-                      'moving_time_hours', 'elevation_gain_m', 'activity_count']].sort_values('week', ascending=False)
+        return self._all_reports(gear_info)['weekly'].copy()
     
     def get_monthly_report(self, gear_info: Optional[Dict[str, str]] = None) -> pd.DataFrame:
         """
@@ -144,35 +293,7 @@ class ActivityAnalyzer:
         Returns:
             DataFrame with monthly shoe statistics
         """
-        if self.df.empty:
-            return pd.DataFrame()
-        
-        monthly = self.df.groupby(['year_month', 'gear_id']).agg({
-            'distance_km': 'sum',
-            'moving_time_hours': 'sum',
-            'elevation_gain_m': 'sum',
-            'id': 'count'
-        }).reset_index()
-        
-        monthly.columns = ['month', 'gear_id', 'distance_km', 'moving_time_hours', 
-                          'elevation_gain_m', 'activity_count']
-        
-        # Add gear names if provided
-        if gear_info:
-            monthly['shoe_name'] = monthly['gear_id'].map(gear_info)
-            monthly['shoe_name'] = monthly['shoe_name'].fillna('Unknown Shoe')
-        else:
-            monthly['shoe_name'] = monthly['gear_id'].apply(
-                lambda x: f'Shoe {x}' if x else 'No Shoe'
-            )
-        
-        # Round values
-        monthly['distance_km'] = monthly['distance_km'].round(2)
-        monthly['moving_time_hours'] = monthly['moving_time_hours'].round(2)
-        monthly['elevation_gain_m'] = monthly['elevation_gain_m'].round(2)
-        
-        return monthly[['month', 'shoe_name', 'gear_id', 'distance_km', 
-                       'moving_time_hours', 'elevation_gain_m', 'activity_count']].sort_values('month', ascending=False)
+        return self._all_reports(gear_info)['monthly'].copy()
     
     def get_yearly_report(self, gear_info: Optional[Dict[str, str]] = None) -> pd.DataFrame:
         """
@@ -184,35 +305,7 @@ class ActivityAnalyzer:
         Returns:
             DataFrame with yearly shoe statistics
         """
-        if self.df.empty:
-            return pd.DataFrame()
-        
-        yearly = self.df.groupby(['year', 'gear_id']).agg({
-            'distance_km': 'sum',
-            'moving_time_hours': 'sum',
-            'elevation_gain_m': 'sum',
-            'id': 'count'
-        }).reset_index()
-        
-        yearly.columns = ['year', 'gear_id', 'distance_km', 'moving_time_hours', 
-                         'elevation_gain_m', 'activity_count']
-        
-        # Add gear names if provided
-        if gear_info:
-            yearly['shoe_name'] = yearly['gear_id'].map(gear_info)
-            yearly['shoe_name'] = yearly['shoe_name'].fillna('Unknown Shoe')
-        else:
-            yearly['shoe_name'] = yearly['gear_id'].apply(
-                lambda x: f'Shoe {x}' if x else 'No Shoe'
-            )
-        
-        # Round values
-        yearly['distance_km'] = yearly['distance_km'].round(2)
-        yearly['moving_time_hours'] = yearly['moving_time_hours'].round(2)
-        yearly['elevation_gain_m'] = yearly['elevation_gain_m'].round(2)
-        
-        return yearly[['year', 'shoe_name', 'gear_id', 'distance_km', 
-                      'moving_time_hours', 'elevation_gain_m', 'activity_count']].sort_values('year', ascending=False)
+        return self._all_reports(gear_info)['yearly'].copy()
     
     def get_activities_by_shoe(self, gear_id: Optional[str] = None) -> pd.DataFrame:
         """
@@ -224,10 +317,7 @@ class ActivityAnalyzer:
         Returns:
             DataFrame with activity details
         """
-        if self.df.empty:
-            return pd.DataFrame()
-        
-        result = self.df.copy()
+        result = self.df
         if gear_id:
             result = result[result['gear_id'] == gear_id]
         
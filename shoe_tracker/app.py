@@ -1,8 +1,14 @@
 """Flask web application for My Shoe Tracker."""
 
+import hashlib
 import os
 import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional
+import pandas as pd
+from cachetools import LRUCache, TTLCache
 from flask import Flask, render_template, request, redirect, url_for, session, flash
 from dotenv import load_dotenv
 from shoe_tracker.strava_client import StravaClient
@@ -27,6 +33,165 @@ STRAVA_CLIENT_ID = os.getenv('STRAVA_CLIENT_ID')
 STRAVA_CLIENT_SECRET = os.getenv('STRAVA_CLIENT_SECRET')
 REDIRECT_URI = 'http://localhost:5000/auth/callback'
 
+# Optional pandas aggregation engine for reports, e.g. 'numba'
+ANALYZER_ENGINE = os.getenv('ANALYZER_ENGINE') or None
+
+# Reports are cached per athlete and lookback window so that switching between
+# pages doesn't refetch from Strava and re-aggregate on every request.
+# Gear changes rarely, so the athlete's shoe list is kept a bit longer.
+REPORT_CACHE_TTL = 300  # seconds
+GEAR_CACHE_TTL = 600  # seconds
+_report_cache = TTLCache(maxsize=128, ttl=REPORT_CACHE_TTL)
+_gear_cache = TTLCache(maxsize=256, ttl=GEAR_CACHE_TTL)
+# Rendered HTML tables, keyed by a hash of the report contents
+_html_cache = LRUCache(maxsize=256)
+_cache_lock = threading.Lock()
+
+
+class Reports(NamedTuple):
+    """All reports computed for one athlete and lookback window."""
+    shoe_summary: pd.DataFrame
+    weekly: pd.DataFrame
+    monthly: pd.DataFrame
+    yearly: pd.DataFrame
+    activity_count: int
+    gear_count: int
+
+
+def warm_up_analyzer() -> None:
+    """
+    Compile the aggregation kernels of ANALYZER_ENGINE, if one is set.
+    
+    Called when the server starts rather than at import, since compiling
+    takes a few seconds, so the first request doesn't pay for it.
+    """
+    if ANALYZER_ENGINE:
+        ActivityAnalyzer.warm_up(ANALYZER_ENGINE)
+
+
+def _token_hash(access_token: str) -> str:
+    """Hash an access token so it is never stored in plaintext as a cache key."""
+    return hashlib.sha256(access_token.encode()).hexdigest()
+
+
+def _render_table(report: pd.DataFrame) -> Optional[str]:
+    """
+    Render a report as an HTML table, reusing the markup of identical reports.
+    
+    Args:
+        report: Report DataFrame
+        
+    Returns:
+        HTML table, or None if the report is empty
+    """
+    if report.empty:
+        return None
+    
+    row_hashes = pd.util.hash_pandas_object(report, index=False).values
+    key = (tuple(report.columns), hashlib.sha256(row_hashes.tobytes()).digest())
+    with _cache_lock:
+        html = _html_cache.get(key)
+    if html is not None:
+        return html
+    
+    html = report.to_html(classes='table table-striped', index=False, escape=True,
+                          float_format='{:.2f}'.format)
+    
+    with _cache_lock:
+        _html_cache[key] = html
+    return html
+
+
+def _valid_access_token() -> str:
+    """
+    Get the session's access token, refreshing it first if it has expired.
+    
+    The token is only refreshed when its stored expiry has passed (or is
+    unknown), and the new tokens are saved back to the session.
+    
+    Returns:
+        Access token that is valid for API requests
+    """
+    access_token = session['access_token']
+    refresh_token = session.get('refresh_token')
+    if not (refresh_token and STRAVA_CLIENT_ID and STRAVA_CLIENT_SECRET):
+        return access_token
+    
+    with StravaClient(access_token, expires_at=session.get('expires_at')) as client:
+        token_data = client.ensure_valid_token(int(STRAVA_CLIENT_ID), STRAVA_CLIENT_SECRET, refresh_token)
+    
+    if token_data is None:
+        return access_token
+    session.update(token_data)
+    return token_data['access_token']
+
+
+def _get_gear_list(access_token: str) -> List[Dict]:
+    """
+    Get the athlete's gear, reusing a cached copy for the same token.
+    
+    Args:
+        access_token: Strava API access token
+        
+    Returns:
+        List of gear dictionaries; a new list on every call, so callers may
+        add or remove entries without affecting the cache
+    """
+    key = _token_hash(access_token)
+    with _cache_lock:
+        gear_list = _gear_cache.get(key)
+    if gear_list is not None:
+        return list(gear_list)
+    
+    with StravaClient(access_token) as client:
+        gear_list = client.get_athlete_gear()
+    
+    with _cache_lock:
+        _gear_cache[key] = gear_list
+    return list(gear_list)
+
+
+def _get_reports(access_token: str, days: int, limit: int) -> Reports:
+    """
+    Fetch activities and gear from Strava and compute all reports, reusing
+    cached results for the same token and lookback window.
+    
+    Args:
+        access_token: Strava API access token
+        days: Number of days to look back
+        limit: Maximum number of activities to fetch
+        
+    Returns:
+        Reports for the requested window
+    """
+    key = (_token_hash(access_token), days, limit)
+    with _cache_lock:
+        reports = _report_cache.get(key)
+    if reports is not None:
+        return reports
+    
+    after = datetime.now() - timedelta(days=days)
+    
+    # Activities and gear are independent requests, so fetch them concurrently
+    with StravaClient(access_token) as client, ThreadPoolExecutor(max_workers=2) as executor:
+        activities_future = executor.submit(client.get_activities_fast, after=after, limit=limit)
+        gear_future = executor.submit(_get_gear_list, access_token)
+        activities = activities_future.result()
+        gear_list = gear_future.result()
+    
+    gear_info = {g['id']: g['name'] for g in gear_list}
+    
+    analyzer = ActivityAnalyzer(activities, engine=ANALYZER_ENGINE)
+    reports = Reports(
+        **analyzer.get_all_reports(gear_info),
+        activity_count=len(activities),
+        gear_count=len(gear_list),
+    )
+    
+    with _cache_lock:
+        _report_cache[key] = reports
+    return reports
+
 
 @app.route('/')
 def index():
@@ -38,34 +203,22 @@ def index():
         return render_template('index.html', authenticated=False)
     
     try:
-        # Fetch activities
-        client = StravaClient(access_token)
+        # Get reports for activities from the last year
+        reports = _get_reports(_valid_access_token(), days=365, limit=200)
         
-        # Get activities from the last year
-        after = datetime.now() - timedelta(days=365)
-        activities = client.get_activities(after=after, limit=200)
-        
-        # Get gear information
-        gear_list = client.get_athlete_gear()
-        gear_info = {g['id']: g['name'] for g in gear_list}
-        
-        # Analyze activities
-        analyzer = ActivityAnalyzer(activities)
-        
-        # Get different report types
-        shoe_summary = analyzer.get_shoe_summary(gear_info)
-        weekly_report = analyzer.get_weekly_report(gear_info).head(10)  # Last 10 weeks
-        monthly_report = analyzer.get_monthly_report(gear_info).head(6)  # Last 6 months
-        yearly_report = analyzer.get_yearly_report(gear_info)
+        shoe_summary = reports.shoe_summary
+        weekly_report = reports.weekly.head(10)  # Last 10 weeks
+        monthly_report = reports.monthly.head(6)  # Last 6 months
+        yearly_report = reports.yearly
         
         return render_template('index.html',
                              authenticated=True,
-                             shoe_summary=shoe_summary.to_html(classes='table table-striped', index=False, escape=True) if not shoe_summary.empty else None,
-                             weekly_report=weekly_report.to_html(classes='table table-striped', index=False, escape=True) if not weekly_report.empty else None,
-                             monthly_report=monthly_report.to_html(classes='table table-striped', index=False, escape=True) if not monthly_report.empty else None,
-                             yearly_report=yearly_report.to_html(classes='table table-striped', index=False, escape=True) if not yearly_report.empty else None,
-                             activity_count=len(activities),
-                             gear_count=len(gear_list))
+                             shoe_summary=_render_table(shoe_summary),
+                             weekly_report=_render_table(weekly_report),
+                             monthly_report=_render_table(monthly_report),
+                             yearly_report=_render_table(yearly_report),
+                             activity_count=reports.activity_count,
+                             gear_count=reports.gear_count)
     except Exception as e:
         flash(f'Error fetching data: {str(e)}', 'error')
         return render_template('index.html', authenticated=True, error=str(e))
@@ -140,19 +293,11 @@ def weekly_report():
         return redirect(url_for('index'))
     
     try:
-        client = StravaClient(access_token)
-        after = datetime.now() - timedelta(days=365)
-        activities = client.get_activities(after=after, limit=200)
-        
-        gear_list = client.get_athlete_gear()
-        gear_info = {g['id']: g['name'] for g in gear_list}
-        
-        analyzer = ActivityAnalyzer(activities)
-        report = analyzer.get_weekly_report(gear_info)
+        report = _get_reports(_valid_access_token(), days=365, limit=200).weekly
         
         return render_template('report.html',
                              title='Weekly Report',
-                             report=report.to_html(classes='table table-striped', index=False, escape=True) if not report.empty else None)
+                             report=_render_table(report))
     except Exception as e:
         flash(f'Error generating report: {str(e)}', 'error')
         return redirect(url_for('index'))
@@ -168,19 +313,11 @@ def monthly_report():
         return redirect(url_for('index'))
     
     try:
-        client = StravaClient(access_token)
-        after = datetime.now() - timedelta(days=365)
-        activities = client.get_activities(after=after, limit=200)
-        
-        gear_list = client.get_athlete_gear()
-        gear_info = {g['id']: g['name'] for g in gear_list}
-        
-        analyzer = ActivityAnalyzer(activities)
-        report = analyzer.get_monthly_report(gear_info)
+        report = _get_reports(_valid_access_token(), days=365, limit=200).monthly
         
         return render_template('report.html',
                              title='Monthly Report',
-                             report=report.to_html(classes='table table-striped', index=False, escape=True) if not report.empty else None)
+                             report=_render_table(report))
     except Exception as e:
         flash(f'Error generating report: {str(e)}', 'error')
         return redirect(url_for('index'))
@@ -196,19 +333,11 @@ def yearly_report():
         return redirect(url_for('index'))
     
     try:
-        client = StravaClient(access_token)
-        after = datetime.now() - timedelta(days=365*3)  # Last 3 years
-        activities = client.get_activities(after=after, limit=500)
-        
-        gear_list = client.get_athlete_gear()
-        gear_info = {g['id']: g['name'] for g in gear_list}
-        
-        analyzer = ActivityAnalyzer(activities)
-        report = analyzer.get_yearly_report(gear_info)
+        report = _get_reports(_valid_access_token(), days=365*3, limit=500).yearly  # Last 3 years
         
         return render_template('report.html',
                              title='Yearly Report',
-                             report=report.to_html(classes='table table-striped', index=False, escape=True) if not report.empty else None)
+                             report=_render_table(report))
     except Exception as e:
         flash(f'Error generating report: {str(e)}', 'error')
         return redirect(url_for('index'))
@@ -218,6 +347,7 @@ def main():
     """Main entry point for the application."""
     port = int(os.getenv('FLASK_PORT', 5000))
     debug = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
+    warm_up_analyzer()
     app.run(host='0.0.0.0', port=port, debug=debug)
 
 
@@ -20,7 +20,7 @@ def format_table(df, title=None):
         return
     
     # Print to string with tabulate style
-    print(df.to_string(index=False))
+    print(df.to_string(index=False, float_format='{:.2f}'.format))
 
 
 def main():
@@ -68,7 +68,8 @@ Examples:
     
     if args.command == 'web':
         # Start web interface
-        from shoe_tracker.app import app
+        from shoe_tracker.app import app, warm_up_analyzer
+        warm_up_analyzer()
         print(f"Starting web interface on http://localhost:{args.port}")
         app.run(host='0.0.0.0', port=args.port, debug=False)
         
@@ -88,11 +89,22 @@ Examples:
         try:
             # Initialize client
             print(f"Fetching activities from the last {args.days} days...")
-            client = StravaClient(access_token)
+            expires_at = os.getenv('STRAVA_TOKEN_EXPIRES_AT')
+            # A one-off report can wait for the next rate-limit window
+            client = StravaClient(access_token, expires_at=int(expires_at) if expires_at else None,
+                                  wait_for_rate_limit=True)
             
-            # Get activities
+            # Refresh the access token if it has expired and a refresh token is configured
+            refresh_token = os.getenv('STRAVA_REFRESH_TOKEN')
+            client_id = os.getenv('STRAVA_CLIENT_ID')
+            client_secret = os.getenv('STRAVA_CLIENT_SECRET')
+            if refresh_token and client_id and client_secret:
+                if client.ensure_valid_token(int(client_id), client_secret, refresh_token):
+                    print("Refreshed the Strava access token")
+            
+            # Get activities and gear information in one round trip
             after = datetime.now() - timedelta(days=args.days)
-            activities = client.get_activities(after=after, limit=500)
+            gear_list, activities = client.sync_snapshot(after=after, limit=500)
             
             if not activities:
                 print("No activities found in the specified time period.")
@@ -100,35 +112,32 @@ Examples:
             
             print(f"Found {len(activities)} activities")
             
-            # Get gear information
-            print("Fetching gear information...")
-            gear_list = client.get_athlete_gear()
             gear_info = {g['id']: g['name'] for g in gear_list}
             
             # Analyze activities
             analyzer = ActivityAnalyzer(activities)
             
             # Generate requested report
-            if args.type == 'summary':
-                report = analyzer.get_shoe_summary(gear_info)
-                format_table(report, "Overall Shoe Summary")
-                
-            elif args.type == 'weekly':
-                report = analyzer.get_weekly_report(gear_info)
-                format_table(report, "Weekly Report")
-                
-            elif args.type == 'monthly':
-                report = analyzer.get_monthly_report(gear_info)
-                format_table(report, "Monthly Report")
-                
-            elif args.type == 'yearly':
-                report = analyzer.get_yearly_report(gear_info)
-                format_table(report, "Yearly Report")
-                
-            elif args.type == 'activities':
+            if args.type == 'activities':
                 report = analyzer.get_activities_by_shoe(args.shoe_id)
                 title = f"Activities for Shoe {args.shoe_id}" if args.shoe_id else "All Activities"
                 format_table(report, title)
+                
+            else:
+                # All aggregated reports come from one pass over the activities
+                reports = analyzer.get_all_reports(gear_info)
+                
+                if args.type == 'summary':
+                    format_table(reports['shoe_summary'], "Overall Shoe Summary")
+                    
+                elif args.type == 'weekly':
+                    format_table(reports['weekly'], "Weekly Report")
+                    
+                elif args.type == 'monthly':
+                    format_table(reports['monthly'], "Monthly Report")
+                    
+                elif args.type == 'yearly':
+                    format_table(reports['yearly'], "Yearly Report")
             
         except Exception as e:
             print(f"Error: {e}")
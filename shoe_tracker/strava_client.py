@@ -1,27 +1,383 @@
 """Strava API client for fetching activity data."""
 
+import calendar
+import functools
+import hashlib
+import json
+import operator
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Union
-from stravalib import Client
+from typing import Iterator, List, Dict, Optional, Tuple, Union
+from urllib.parse import urlencode
+import requests
+from cachetools import TTLCache
+from pydantic import BaseModel, TypeAdapter, field_validator
+from requests.adapters import HTTPAdapter
+from stravalib import Client, model
 from stravalib.strava_model import SummaryActivity, DetailedActivity
 
+try:
+    import orjson
+except ImportError:  # optional dependency, the standard library parser is used instead
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # optional dependency, only needed for on-disk response caching
+    requests_cache = None
+
+API_BASE_URL = 'https://www.strava.com/api/v3'
+# Connection pool sizing for the HTTP session shared by all requests of a client
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 20
+# Concurrent requests when fetching several activity details; kept well within
+# the pool size, so every worker reuses its own keep-alive connection, and
+# within Strava's rate limits
+DETAIL_WORKERS = 10
+# Largest page size accepted by Strava's activity list endpoint
+ACTIVITIES_PER_PAGE = 200
+# Activity details kept in memory so that retries and overlapping backfills
+# don't refetch them; keyed by a hash of the access token and the activity ID
+DETAIL_CACHE_SIZE = 1024
+DETAIL_CACHE_TTL = 3600  # seconds
+_detail_cache = TTLCache(maxsize=DETAIL_CACHE_SIZE, ttl=DETAIL_CACHE_TTL)
+_detail_cache_lock = threading.Lock()
+# Refresh access tokens this many seconds before they actually expire
+TOKEN_EXPIRY_MARGIN = 60
+# Strava's short-term rate limit applies to clock-aligned 15-minute windows
+RATE_LIMIT_WINDOW = 15 * 60
+# Requests left in a window, after those already in flight, below which
+# requests wait for the next window; kept for requests made outside the pacer.
+# Also the most requests sent at once before any response reported the quota.
+RATE_LIMIT_RESERVE = 5
+# Strava reports an overall and a read (GET) quota as "limit15,limitDaily"
+# and "used15,usedDaily"; requests are paced by the tighter of the two
+RATE_LIMIT_HEADERS = (
+    ('X-RateLimit-Limit', 'X-RateLimit-Usage'),
+    ('X-ReadRateLimit-Limit', 'X-ReadRateLimit-Usage'),
+)
+# Times a request answered with 429 Too Many Requests is retried in the next
+# window, by clients that wait for the rate limits
+RATE_LIMIT_RETRIES = 1
+# The daily quota resets at midnight UTC
+RATE_LIMIT_DAY = 24 * 60 * 60
+# Per-URL lifetimes of cached responses when a cache path is given; the first
+# matching prefix wins. These lifetimes take precedence over the response's
+# Cache-Control headers, which Strava sets to revalidate on every request.
+# Expired entries are revalidated with ETags, so a repeat request costs a 304
+# without a body. Activity list pages expire immediately and are always
+# revalidated.
+CACHE_URLS_EXPIRE_AFTER = {
+    'www.strava.com/api/v3/athlete/activities': 0,
+    'www.strava.com/api/v3/athlete': timedelta(hours=1),
+    'www.strava.com/api/v3/activities/': timedelta(days=7),
+}
+
+# JSON parser for activity list pages
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Token fields kept from stravalib's AccessInfo
+_TOKEN_KEYS = ('access_token', 'refresh_token', 'expires_at')
+_TOKEN_FIELDS = operator.itemgetter(*_TOKEN_KEYS)
+
+
+def _cache_key(request, **kwargs) -> str:
+    """
+    Cache key of a request for requests-cache, specific to its access token.
+    
+    requests-cache strips the Authorization header before matching headers,
+    so athletes sharing a cache file would see each other's data; the token
+    is hashed into the key instead of being stored in the cache.
+    """
+    key = requests_cache.create_key(request, **kwargs)
+    return hashlib.sha256(f"{key}:{request.headers.get('Authorization', '')}".encode()).hexdigest()
+
+
+def _normalize_token(token_response) -> Dict[str, str]:
+    """
+    Reduce a stravalib token response to the fields the app stores.
+    
+    Args:
+        token_response: AccessInfo, or a tuple starting with one (stravalib v2
+            may return extra info alongside it)
+        
+    Returns:
+        Dictionary with access_token, refresh_token and expires_at
+    """
+    if isinstance(token_response, tuple):
+        token_response = token_response[0]
+    return dict(zip(_TOKEN_KEYS, _TOKEN_FIELDS(token_response)))
+
+
+def _epoch(value: Optional[datetime]) -> Optional[int]:
+    """Convert a datetime to Unix seconds, treating naive values as UTC like stravalib."""
+    return calendar.timegm(value.utctimetuple()) if value else None
+
+
+def _window_query(after: Optional[datetime], before: Optional[datetime]) -> str:
+    """Encode the after/before bounds of a sync once, as a suffix for every page's query string."""
+    query = urlencode({name: _epoch(value) for name, value in (('after', after), ('before', before)) if value})
+    return f'&{query}' if query else ''
+
+
+class GearOut(BaseModel):
+    """A piece of the athlete's gear, as returned by get_athlete_gear."""
+    id: str
+    name: Optional[str] = None
+    distance: float = 0.0
+    primary: bool = False
+    
+    @field_validator('distance', 'primary', mode='before')
+    @classmethod
+    def _none_to_default(cls, value, info):
+        # Strava leaves these unset for some gear; fall back to the field default
+        return cls.model_fields[info.field_name].default if value is None else value
+
+
+class _AthleteGear(BaseModel):
+    """The gear of an athlete response; every other athlete field is ignored."""
+    shoes: Optional[List[GearOut]] = None
+
+
+# Dumps the whole shoe list in one call instead of a Python loop per shoe
+_GEAR_ADAPTER = TypeAdapter(List[GearOut])
+
+
+class ActivityRecord(BaseModel):
+    """The subset of an activity's fields that the reports use."""
+    id: int
+    name: Optional[str] = None
+    type: Optional[str] = None
+    start_date_local: datetime
+    distance: Optional[float] = None
+    moving_time: Optional[int] = None
+    elapsed_time: Optional[int] = None
+    total_elevation_gain: Optional[float] = None
+    gear_id: Optional[str] = None
+
+
+# Parses a page of activities straight from the response bytes, skipping the
+# fields (maps, segments, athlete, ...) that the full SummaryActivity validates
+_ACTIVITY_RECORDS_ADAPTER = TypeAdapter(List[ActivityRecord])
+
+
+class RateLimitExceeded(requests.HTTPError):
+    """Raised when a request would exceed, or was refused for, Strava's rate limits."""
+
+
+class _RateLimiter:
+    """
+    Remaining Strava quota and the requests currently claimed from it.
+    
+    Strava counts requests per application, not per client or access token,
+    so every client in the process shares one limiter; the web app creates a
+    client per request and couldn't pace them on its own.
+    """
+    
+    def __init__(self):
+        # Remaining requests in the 15-minute window numbered _window and on the
+        # UTC day numbered _day, from response headers, and paced requests sent
+        # but not yet answered
+        self.remaining_15min: Optional[int] = None
+        self.remaining_daily: Optional[int] = None
+        self._window: Optional[int] = None
+        self._day: Optional[int] = None
+        self._in_flight = 0
+        self._cond = threading.Condition()
+    
+    def update(self, headers) -> None:
+        """Record the remaining quotas from Strava's rate-limit headers."""
+        remaining = []
+        for limit_header, usage_header in RATE_LIMIT_HEADERS:
+            limit = headers.get(limit_header)
+            usage = headers.get(usage_header)
+            if limit and usage:
+                remaining.append([int(l) - int(u) for l, u in zip(limit.split(','), usage.split(','))])
+        if remaining:
+            now = time.time()
+            with self._cond:
+                self.remaining_15min = min(quota[0] for quota in remaining)
+                self.remaining_daily = min(quota[-1] for quota in remaining)
+                self._window = int(now // RATE_LIMIT_WINDOW)
+                self._day = int(now // RATE_LIMIT_DAY)
+                self._cond.notify_all()
+    
+    def daily_exhausted(self) -> bool:
+        """Whether today's quota is known to be used up."""
+        with self._cond:
+            return self._daily_exhausted(time.time())
+    
+    def _daily_exhausted(self, now: float) -> bool:
+        """Check the daily quota with the condition held."""
+        return (self.remaining_daily is not None and self._day == int(now // RATE_LIMIT_DAY)
+                and self.remaining_daily - self._in_flight <= 0)
+    
+    def acquire(self, wait: bool) -> None:
+        """
+        Claim a request from the current window's quota.
+        
+        Args:
+            wait: Wait for the next window when the quota is used up instead of
+                raising. The daily quota is never waited for.
+        """
+        with self._cond:
+            while True:
+                now = time.time()
+                if self._daily_exhausted(now):
+                    raise RateLimitExceeded("Strava's daily rate limit is used up; "
+                                            "it resets at midnight UTC")
+                if self.remaining_15min is None or self._window != int(now // RATE_LIMIT_WINDOW):
+                    # Nothing known about this window yet; send no more than the
+                    # reserve until a response reports the remaining quota
+                    if self._in_flight < RATE_LIMIT_RESERVE:
+                        break
+                    self._cond.wait()
+                elif self.remaining_15min - self._in_flight > RATE_LIMIT_RESERVE:
+                    # The server's count doesn't include requests still in flight,
+                    # so those are subtracted; otherwise concurrent workers would
+                    # all see the same remaining quota and overrun it together
+                    break
+                elif wait:
+                    self._cond.wait(RATE_LIMIT_WINDOW - now % RATE_LIMIT_WINDOW)
+                else:
+                    minutes = int(RATE_LIMIT_WINDOW - now % RATE_LIMIT_WINDOW) // 60 + 1
+                    raise RateLimitExceeded("Strava's 15-minute rate limit is used up; "
+                                            f"try again in {minutes} min")
+            self._in_flight += 1
+    
+    def release(self) -> None:
+        """Return a claim once its request has been answered."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+
+# Shared by all clients; looked up on every request so tests can replace it
+_rate_limits = _RateLimiter()
+
 
 class StravaClient:
     """Client for interacting with the Strava API."""
     
-    def __init__(self, access_token: Optional[str] = None):
+    # The web app creates a client per request, so skip the per-instance __dict__
+    __slots__ = ('access_token', 'expires_at', 'client', 'wait_for_rate_limit', '_session')
+    
+    def __init__(self, access_token: Optional[str] = None, expires_at: Optional[int] = None,
+                 cache_path: Optional[str] = None, wait_for_rate_limit: bool = False):
         """
         Initialize the Strava client.
         
         Args:
             access_token: Strava API access token. If not provided, will try to get from environment.
+            expires_at: Expiry of the access token as a Unix timestamp, if known
+            cache_path: SQLite file for caching gear and activity detail responses
+                on disk. Requires the optional requests-cache package.
+            wait_for_rate_limit: Wait for the next 15-minute window when the
+                rate limit is used up, instead of raising RateLimitExceeded.
+                Meant for the CLI; a web request shouldn't block for minutes.
         """
         self.access_token = access_token or os.getenv('STRAVA_ACCESS_TOKEN')
-        self.client = Client()
+        self.expires_at = expires_at
+        self.wait_for_rate_limit = wait_for_rate_limit
+        # Keep-alive session so consecutive API calls reuse the same TLS connection
+        if cache_path:
+            if requests_cache is None:
+                raise ImportError("Response caching requires requests-cache: "
+                                  "pip install 'my-shoe-tracker[cache]'")
+            self._session = requests_cache.CachedSession(
+                cache_path,
+                backend='sqlite',
+                expire_after=requests_cache.DO_NOT_CACHE,
+                urls_expire_after=CACHE_URLS_EXPIRE_AFTER,
+                key_fn=_cache_key,
+            )
+        else:
+            self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                                    pool_maxsize=POOL_MAXSIZE))
+        self.client = Client(requests_session=self._session)
+        self._session.hooks['response'].append(self._update_rate_limits)
         if self.access_token:
             self.client.access_token = self.access_token
     
+    def __enter__(self) -> 'StravaClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self._session.close()
+    
+    def _require_token(self) -> None:
+        """Raise if no access token is available."""
+        if not self.access_token:
+            raise ValueError("No access token available. Please authorize first.")
+    
+    @property
+    def remaining_15min(self) -> Optional[int]:
+        """Requests left in the current 15-minute window, shared by all clients."""
+        return _rate_limits.remaining_15min
+    
+    def _update_rate_limits(self, response: requests.Response, *args, **kwargs) -> None:
+        """Record the remaining quotas from Strava's rate-limit headers."""
+        if getattr(response, 'from_cache', False):
+            # Cached responses carry the headers of the original, stale request
+            return
+        _rate_limits.update(response.headers)
+    
+    def _acquire_quota(self) -> None:
+        """Claim a request from the shared quota, waiting for the next window only if enabled."""
+        _rate_limits.acquire(self.wait_for_rate_limit)
+    
+    @staticmethod
+    def _sleep_until_next_window() -> None:
+        """Sleep until the next 15-minute rate-limit window starts."""
+        time.sleep(RATE_LIMIT_WINDOW - time.time() % RATE_LIMIT_WINDOW)
+    
+    def _paced_get(self, url: str) -> requests.Response:
+        """
+        GET a Strava API URL on the session without exceeding the rate limits.
+        
+        Requests go out as fast as the remaining quota allows, with no fixed
+        delay. A 429 response, e.g. because another process used up the shared
+        quota, is retried in the next window by clients that wait for the rate
+        limits and raises RateLimitExceeded right away otherwise.
+        
+        Args:
+            url: Full request URL
+            
+        Returns:
+            Successful response
+        """
+        for retry in range(RATE_LIMIT_RETRIES + 1):
+            self._acquire_quota()
+            try:
+                # Sent per request rather than set on the session, which stravalib
+                # also uses for the OAuth token exchange
+                response = self._session.get(url, headers={'Authorization': f'Bearer {self.access_token}'})
+            finally:
+                _rate_limits.release()
+            if response.status_code != 429:
+                break
+            if (not self.wait_for_rate_limit or retry == RATE_LIMIT_RETRIES
+                    or _rate_limits.daily_exhausted()):
+                raise RateLimitExceeded("Strava's rate limit is used up", response=response)
+            self._sleep_until_next_window()
+        
+        response.raise_for_status()
+        return response
+    
+    def _set_token(self, token_data: Dict[str, str]) -> None:
+        """Use a newly issued access token for subsequent requests."""
+        self.access_token = token_data['access_token']
+        self.client.access_token = self.access_token
+        self.expires_at = token_data['expires_at']
+    
     def authorize(self, client_id: int, client_secret: str, code: str) -> Dict[str, str]:
         """
         Exchange authorization code for access token.
@@ -34,23 +390,13 @@ class StravaClient:
         Returns:
             Dictionary with access_token and refresh_token
         """
-        token_response = self.client.exchange_code_for_token(
+        token_data = _normalize_token(self.client.exchange_code_for_token(
             client_id=client_id,
             client_secret=client_secret,
             code=code
-        )
-        # In stravalib v2, exchange_code_for_token returns AccessInfo (TypedDict) or tuple
-        # If it's a tuple, extract the AccessInfo part
-        if isinstance(token_response, tuple):
-            token_response = token_response[0]
-            
-        self.access_token = token_response['access_token']
-        self.client.access_token = self.access_token
-        return {
-            'access_token': token_response['access_token'],
-            'refresh_token': token_response['refresh_token'],
-            'expires_at': token_response['expires_at']
-        }
+        ))
+        self._set_token(token_data)
+        return token_data
     
     def refresh_access_token(self, client_id: int, client_secret: str, refresh_token: str) -> Dict[str, str]:
         """
@@ -64,19 +410,30 @@ class StravaClient:
         Returns:
             Dictionary with new access_token and refresh_token
         """
-        token_response = self.client.refresh_access_token(
+        token_data = _normalize_token(self.client.refresh_access_token(
             client_id=client_id,
             client_secret=client_secret,
             refresh_token=refresh_token
-        )
-        # In stravalib v2, refresh_access_token returns AccessInfo (TypedDict)
-        self.access_token = token_response['access_token']
-        self.client.access_token = self.access_token
-        return {
-            'access_token': token_response['access_token'],
-            'refresh_token': token_response['refresh_token'],
-            'expires_at': token_response['expires_at']
-        }
+        ))
+        self._set_token(token_data)
+        return token_data
+    
+    def ensure_valid_token(self, client_id: int, client_secret: str, refresh_token: str) -> Optional[Dict[str, str]]:
+        """
+        Refresh the access token only if it has expired or is about to.
+        
+        Args:
+            client_id: Strava application client ID
+            client_secret: Strava application client secret
+            refresh_token: Refresh token
+            
+        Returns:
+            Dictionary with the new access_token and refresh_token if the token
+            was refreshed, or None if the current token is still valid
+        """
+        if self.access_token and self.expires_at and time.time() < self.expires_at - TOKEN_EXPIRY_MARGIN:
+            return None
+        return self.refresh_access_token(client_id, client_secret, refresh_token)
     
     def get_activities(self, after: Optional[datetime] = None, before: Optional[datetime] = None, limit: int = 200) -> List[Union[SummaryActivity, DetailedActivity]]:
         """
@@ -90,14 +447,127 @@ class StravaClient:
         Returns:
             List of SummaryActivity or DetailedActivity objects
         """
-        if not self.access_token:
-            raise ValueError("No access token available. Please authorize first.")
+        return list(self.iter_activities(after=after, before=before, limit=limit))
+    
+    def iter_activities(self, after: Optional[datetime] = None, before: Optional[datetime] = None, limit: int = 200) -> Iterator[Union[SummaryActivity, DetailedActivity]]:
+        """
+        Iterate over activities from Strava as they are fetched, page by page.
+        
+        Args:
+            after: Only return activities after this date
+            before: Only return activities before this date
+            limit: Maximum number of activities to return
+            
+        Yields:
+            SummaryActivity or DetailedActivity objects
+        """
+        self._require_token()
+        
+        # Encode the window once rather than for every page
+        fetch_page = functools.partial(self._fetch_activity_page, query=_window_query(after, before))
+        yield from self._paginate(fetch_page, limit)
+    
+    def get_activities_fast(self, after: Optional[datetime] = None, before: Optional[datetime] = None,
+                            limit: int = 200, max_workers: int = DETAIL_WORKERS) -> List[ActivityRecord]:
+        """
+        Fetch activities from Strava as lightweight records.
+        
+        Only the fields used by the reports are parsed, directly from the JSON
+        response, which is much cheaper than building full stravalib models for
+        large syncs. Pages are requested like get_activities_parallel does.
+        
+        Args:
+            after: Only return activities after this date
+            before: Only return activities before this date
+            limit: Maximum number of activities to return
+            max_workers: Maximum number of page requests in flight at once
+            
+        Returns:
+            List of ActivityRecord objects, newest first
+        """
+        self._require_token()
         
-        activities = []
-        for activity in self.client.get_activities(after=after, before=before, limit=limit):
-            activities.append(activity)
+        fetch_page = functools.partial(self._fetch_activity_records, query=_window_query(after, before))
+        return self._fetch_pages(fetch_page, limit, max_workers)
+    
+    @staticmethod
+    def _paginate(fetch_page, limit: int) -> Iterator:
+        """Yield up to limit items from fetch_page(page, per_page), page by page."""
+        per_page = min(limit, ACTIVITIES_PER_PAGE)
+        page = 1
         
-        return activities
+        while limit > 0:
+            items = fetch_page(page, per_page)
+            yield from items[:limit]
+            limit -= len(items)
+            if len(items) < per_page:
+                return
+            page += 1
+    
+    def get_activities_parallel(self, after: Optional[datetime] = None, before: Optional[datetime] = None,
+                                limit: int = 200, max_workers: int = DETAIL_WORKERS) -> List[SummaryActivity]:
+        """
+        Fetch activities from Strava, requesting the pages after the first concurrently.
+        
+        Unlike get_activities, which requests each page only after the previous
+        one has been consumed, this pays roughly two round trips for the whole
+        window. The first page is requested on its own, so a window that fits
+        in one page never costs more than one request.
+        
+        Args:
+            after: Only return activities after this date
+            before: Only return activities before this date
+            limit: Maximum number of activities to return
+            max_workers: Maximum number of page requests in flight at once
+            
+        Returns:
+            List of SummaryActivity objects, newest first
+        """
+        self._require_token()
+        
+        fetch_page = functools.partial(self._fetch_activity_page, query=_window_query(after, before))
+        return self._fetch_pages(fetch_page, limit, max_workers)
+    
+    @staticmethod
+    def _fetch_pages(fetch_page, limit: int, max_workers: int) -> List:
+        """Fetch up to limit items from fetch_page(page, per_page), fanning out after a full first page."""
+        if limit <= 0:
+            return []
+        
+        per_page = min(limit, ACTIVITIES_PER_PAGE)
+        total_pages = -(-limit // per_page)
+        
+        items = fetch_page(1, per_page)
+        if len(items) < per_page or total_pages == 1:
+            # A short page is the last one; later pages are empty
+            return items[:limit]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, total_pages - 1)) as executor:
+            futures = [executor.submit(fetch_page, page, per_page) for page in range(2, total_pages + 1)]
+            for future in futures:
+                page = future.result()
+                items.extend(page)
+                if len(page) < per_page:
+                    # Pages after a short one are empty; drop those not yet sent
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        
+        return items[:limit]
+    
+    def _get_activity_page(self, page: int, per_page: int, query: str) -> bytes:
+        """Request one page of the athlete's activities and return the raw JSON body."""
+        return self._paced_get(f'{API_BASE_URL}/athlete/activities?page={page}&per_page={per_page}{query}').content
+    
+    def _fetch_activity_page(self, page: int, per_page: int, query: str) -> List[SummaryActivity]:
+        """Fetch one page of the athlete's activities."""
+        raw_activities = _json_loads(self._get_activity_page(page, per_page, query))
+        return [model.SummaryActivity.model_validate({**raw, 'bound_client': self.client})
+                for raw in raw_activities]
+    
+    def _fetch_activity_records(self, page: int, per_page: int, query: str) -> List[ActivityRecord]:
+        """Fetch one page of the athlete's activities as ActivityRecord objects."""
+        return _ACTIVITY_RECORDS_ADAPTER.validate_json(self._get_activity_page(page, per_page, query))
     
     def get_activity_details(self, activity_id: int) -> DetailedActivity:
         """
@@ -109,10 +579,74 @@ class StravaClient:
         Returns:
             DetailedActivity object
         """
-        if not self.access_token:
-            raise ValueError("No access token available. Please authorize first.")
+        self._require_token()
+        
+        return self._fetch_activity_details(activity_id, hashlib.sha256(self.access_token.encode()).hexdigest())
+    
+    def _fetch_activity_details(self, activity_id: int, token_hash: str) -> DetailedActivity:
+        """Fetch one activity's details, assuming a token is available."""
+        key = (token_hash, activity_id)
+        with _detail_cache_lock:
+            activity = _detail_cache.get(key)
+        if activity is None:
+            activity = self._request_activity_details(activity_id)
+            with _detail_cache_lock:
+                _detail_cache[key] = activity
         
-        return self.client.get_activity(activity_id)
+        # The cache holds unbound models, so it never keeps a (possibly closed)
+        # client alive; every caller gets its own shallow copy bound to this
+        # client, sharing the nested fields (segments, laps, ...) read-only
+        return activity.model_copy(update={'bound_client': self.client})
+    
+    def _request_activity_details(self, activity_id: int) -> DetailedActivity:
+        """Request one activity's details from Strava, without binding them to a client."""
+        # Only real requests are paced; cached details never get here.
+        # Requested on the session directly and validated straight from the JSON bytes
+        response = self._paced_get(f'{API_BASE_URL}/activities/{activity_id}')
+        return model.DetailedActivity.model_validate_json(response.content)
+    
+    def get_activity_details_many(self, activity_ids: List[int],
+                                  max_workers: int = DETAIL_WORKERS) -> List[DetailedActivity]:
+        """
+        Get detailed information for several activities concurrently.
+        
+        Args:
+            activity_ids: IDs of the activities
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            DetailedActivity objects, in the same order as activity_ids
+        """
+        # Check the token and hash it once for the batch, not once per activity
+        self._require_token()
+        token_hash = hashlib.sha256(self.access_token.encode()).hexdigest()
+        
+        fetch = functools.partial(self._fetch_activity_details, token_hash=token_hash)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, activity_ids))
+    
+    def sync_snapshot(self, after: Optional[datetime] = None, before: Optional[datetime] = None,
+                      limit: int = 200) -> Tuple[List[Dict], List[ActivityRecord]]:
+        """
+        Fetch the athlete's gear and activities concurrently.
+        
+        The two requests are independent, so a sync costs one round trip
+        instead of two back-to-back ones.
+        
+        Args:
+            after: Only return activities after this date
+            before: Only return activities before this date
+            limit: Maximum number of activities to return
+            
+        Returns:
+            Tuple of the gear dictionaries and the list of ActivityRecord objects
+        """
+        self._require_token()
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            gear_future = executor.submit(self.get_athlete_gear)
+            activities = self.get_activities_fast(after=after, before=before, limit=limit)
+            return gear_future.result(), activities
     
     def get_athlete_gear(self) -> List[Dict]:
         """
@@ -121,19 +655,11 @@ class StravaClient:
         Returns:
             List of gear dictionaries
         """
-        if not self.access_token:
-            raise ValueError("No access token available. Please authorize first.")
-        
-        athlete = self.client.get_athlete()
-        gear = []
+        self._require_token()
         
-        if hasattr(athlete, 'shoes'):
-            for shoe in athlete.shoes:
-                gear.append({
-                    'id': shoe.id,
-                    'name': shoe.name,
-                    'distance': float(shoe.distance) if shoe.distance else 0.0,
-                    'primary': getattr(shoe, 'primary', False)
-                })
+        # Requested on the pooled session like the other hot paths, and only
+        # the shoes are parsed out of the athlete response
+        response = self._paced_get(f'{API_BASE_URL}/athlete')
+        athlete = _AthleteGear.model_validate_json(response.content)
         
-        return gear
+        return _GEAR_ADAPTER.dump_python(athlete.shoes or [])
@@ -0,0 +1,111 @@
+"""Tests for the activity analyzer reports."""
+
+from datetime import datetime
+
+import pytest
+
+from shoe_tracker.analyzer import ActivityAnalyzer
+from shoe_tracker.strava_client import ActivityRecord
+
+GEAR_INFO = {'g1': 'Pegasus'}
+
+
+@pytest.fixture
+def activities():
+    """Activities spanning a year boundary, one without gear and one with unnamed gear."""
+    return [
+        ActivityRecord(id=1, name='Morning Run', type='Run', start_date_local=datetime(2024, 12, 30, 7),
+                       distance=10000, moving_time=3600, total_elevation_gain=50, gear_id='g1'),
+        ActivityRecord(id=2, name='Easy Run', type='Run', start_date_local=datetime(2025, 1, 2, 7),
+                       distance=5000, moving_time=1800, gear_id='g1'),
+        ActivityRecord(id=3, name='Treadmill', type='Run', start_date_local=datetime(2025, 2, 1, 7),
+                       distance=8000, moving_time=2400),
+        ActivityRecord(id=4, name='Walk', type='Walk', start_date_local=datetime(2025, 2, 3, 7),
+                       distance=3000, moving_time=1800, gear_id='g9'),
+    ]
+
+
+def test_shoe_summary(activities):
+    summary = ActivityAnalyzer(activities).get_shoe_summary(GEAR_INFO)
+    
+    assert summary.to_dict('records') == [
+        {'shoe_name': 'Pegasus', 'gear_id': 'g1', 'total_distance_km': 15.0,
+         'total_moving_time_hours': 1.5, 'total_elevation_gain_m': 50.0, 'activity_count': 2},
+        {'shoe_name': 'Unknown Shoe', 'gear_id': 'g9', 'total_distance_km': 3.0,
+         'total_moving_time_hours': 0.5, 'total_elevation_gain_m': 0.0, 'activity_count': 1},
+    ]
+
+
+def test_shoe_names_without_gear_info(activities):
+    summary = ActivityAnalyzer(activities).get_shoe_summary()
+    
+    assert list(summary['shoe_name']) == ['Shoe g1', 'Shoe g9']
+
+
+def test_weekly_report_uses_iso_weeks(activities):
+    weekly = ActivityAnalyzer(activities).get_weekly_report(GEAR_INFO)
+    
+    # 2024-12-30 falls in ISO week 1 of 2025; most recent week first
+    assert list(weekly['week']) == ['2025-W06', '2025-W01']
+    assert list(weekly['distance_km']) == [3.0, 15.0]
+    assert list(weekly['activity_count']) == [1, 2]
+
+
+def test_monthly_and_yearly_reports(activities):
+    analyzer = ActivityAnalyzer(activities)
+    monthly = analyzer.get_monthly_report(GEAR_INFO)
+    yearly = analyzer.get_yearly_report(GEAR_INFO)
+    
+    assert list(monthly['month']) == ['2025-02', '2025-01', '2024-12']
+    assert list(monthly['shoe_name']) == ['Unknown Shoe', 'Pegasus', 'Pegasus']
+    assert list(yearly['year']) == [2025, 2025, 2024]
+    assert list(yearly['distance_km']) == [3.0, 5.0, 10.0]
+
+
+def test_get_all_reports_matches_single_reports(activities):
+    analyzer = ActivityAnalyzer(activities)
+    reports = analyzer.get_all_reports(GEAR_INFO)
+    
+    assert set(reports) == {'shoe_summary', 'weekly', 'monthly', 'yearly'}
+    assert reports['shoe_summary'].equals(analyzer.get_shoe_summary(GEAR_INFO))
+    assert reports['weekly'].equals(analyzer.get_weekly_report(GEAR_INFO))
+    assert reports['monthly'].equals(analyzer.get_monthly_report(GEAR_INFO))
+    assert reports['yearly'].equals(analyzer.get_yearly_report(GEAR_INFO))
+
+
+def test_reports_are_copies(activities):
+    analyzer = ActivityAnalyzer(activities)
+    cached = analyzer.get_all_reports(GEAR_INFO)['shoe_summary']
+    cached['total_distance_km'] = 0.0
+    analyzer.get_shoe_summary(GEAR_INFO).drop(columns='shoe_name', inplace=True)
+    
+    summary = analyzer.get_shoe_summary(GEAR_INFO)
+    assert list(summary['total_distance_km']) == [15.0, 3.0]
+    assert 'shoe_name' in summary
+
+
+def test_distances_are_not_rounded(activities):
+    activities[0].distance = 10000.3
+    summary = ActivityAnalyzer(activities).get_shoe_summary(GEAR_INFO)
+    
+    assert summary['total_distance_km'][0] == pytest.approx(15.0003, abs=1e-12)
+
+
+def test_empty_analyzer():
+    analyzer = ActivityAnalyzer([])
+    reports = analyzer.get_all_reports()
+    
+    assert all(report.empty for report in reports.values())
+    assert 'activity_count' in reports['weekly']
+    assert analyzer.get_activities_by_shoe().empty
+    
+    # Each empty analyzer gets its own frame
+    analyzer.df['extra'] = 1
+    assert 'extra' not in ActivityAnalyzer([]).df
+
+
+def test_activities_by_shoe(activities):
+    result = ActivityAnalyzer(activities).get_activities_by_shoe('g1')
+    
+    assert list(result['name']) == ['Easy Run', 'Morning Run']
+    assert list(result['type']) == ['Run', 'Run']
@@ -0,0 +1,177 @@
+"""Tests for the Strava client's request pacing and paging, against a fake HTTP adapter."""
+
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+import shoe_tracker.strava_client as strava_client
+from shoe_tracker.strava_client import API_BASE_URL, RATE_LIMIT_RESERVE, RateLimitExceeded, StravaClient
+
+
+class FakeAdapter(BaseAdapter):
+    """Answers requests from a handler and records them."""
+    
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.requests = []
+    
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status, body, headers = self.handler(request)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = json.dumps(body).encode()
+        return response
+    
+    def close(self):
+        pass
+
+
+def rate_limit_headers(used_15min=1, used_daily=1, limit_15min=100, limit_daily=1000):
+    return {
+        'X-RateLimit-Limit': f'{limit_15min},{limit_daily}',
+        'X-RateLimit-Usage': f'{used_15min},{used_daily}',
+    }
+
+
+@pytest.fixture(autouse=True)
+def rate_limits(monkeypatch):
+    """Give every test a fresh shared limiter."""
+    limiter = strava_client._RateLimiter()
+    monkeypatch.setattr(strava_client, '_rate_limits', limiter)
+    return limiter
+
+
+def make_client(handler, **kwargs):
+    client = StravaClient('token', **kwargs)
+    adapter = FakeAdapter(handler)
+    client._session.mount('https://', adapter)
+    return client, adapter
+
+
+def test_paced_get_sends_token_per_request():
+    client, adapter = make_client(lambda request: (200, {}, rate_limit_headers()))
+    
+    client._paced_get(f'{API_BASE_URL}/athlete')
+    
+    assert adapter.requests[0].headers['Authorization'] == 'Bearer token'
+    assert 'Authorization' not in client._session.headers
+
+
+def test_rate_limits_are_shared_between_clients():
+    client, _ = make_client(lambda request: (200, {}, rate_limit_headers(used_15min=40, limit_15min=100)))
+    
+    client._paced_get(f'{API_BASE_URL}/athlete')
+    
+    assert client.remaining_15min == 60
+    assert StravaClient('other').remaining_15min == 60
+
+
+def test_tighter_read_limit_wins(rate_limits):
+    headers = {**rate_limit_headers(used_15min=10), 'X-ReadRateLimit-Limit': '50,500',
+               'X-ReadRateLimit-Usage': '45,100'}
+    
+    rate_limits.update(headers)
+    
+    assert rate_limits.remaining_15min == 5
+    assert rate_limits.remaining_daily == 400
+
+
+def test_acquire_counts_requests_in_flight(rate_limits):
+    rate_limits.update(rate_limit_headers(used_15min=100 - RATE_LIMIT_RESERVE - 2))
+    
+    rate_limits.acquire(wait=False)
+    rate_limits.acquire(wait=False)
+    with pytest.raises(RateLimitExceeded):
+        rate_limits.acquire(wait=False)
+    
+    rate_limits.release()
+    rate_limits.acquire(wait=False)
+
+
+def test_exhausted_window_raises_without_waiting():
+    client, adapter = make_client(lambda request: (200, {}, rate_limit_headers(used_15min=100)))
+    client._paced_get(f'{API_BASE_URL}/athlete')
+    
+    with pytest.raises(RateLimitExceeded, match='15-minute'):
+        client._paced_get(f'{API_BASE_URL}/athlete')
+    assert len(adapter.requests) == 1
+
+
+def test_429_raises_right_away_by_default(monkeypatch):
+    monkeypatch.setattr(StravaClient, '_sleep_until_next_window', staticmethod(pytest.fail))
+    client, adapter = make_client(lambda request: (429, {}, rate_limit_headers(used_15min=3)))
+    
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        client._paced_get(f'{API_BASE_URL}/athlete')
+    
+    assert excinfo.value.response.status_code == 429
+    assert len(adapter.requests) == 1
+
+
+def test_429_is_retried_when_waiting(monkeypatch):
+    monkeypatch.setattr(StravaClient, '_sleep_until_next_window', staticmethod(lambda: None))
+    statuses = iter([429, 200])
+    client, adapter = make_client(lambda request: (next(statuses), {'id': 1}, rate_limit_headers(used_15min=3)),
+                                  wait_for_rate_limit=True)
+    
+    response = client._paced_get(f'{API_BASE_URL}/athlete')
+    
+    assert response.json() == {'id': 1}
+    assert len(adapter.requests) == 2
+
+
+def test_exhausted_daily_limit_is_fatal(monkeypatch):
+    monkeypatch.setattr(StravaClient, '_sleep_until_next_window', staticmethod(pytest.fail))
+    client, adapter = make_client(lambda request: (429, {}, rate_limit_headers(used_15min=3, used_daily=1000)),
+                                  wait_for_rate_limit=True)
+    
+    with pytest.raises(RateLimitExceeded):
+        client._paced_get(f'{API_BASE_URL}/athlete')
+    with pytest.raises(RateLimitExceeded, match='daily'):
+        client._paced_get(f'{API_BASE_URL}/athlete')
+    assert len(adapter.requests) == 1
+
+
+def activity_pages(count):
+    """Handler serving count activities through the paged activity list endpoint."""
+    def handler(request):
+        query = parse_qs(urlparse(request.url).query)
+        page, per_page = int(query['page'][0]), int(query['per_page'][0])
+        ids = range((page - 1) * per_page + 1, min(page * per_page, count) + 1)
+        body = [{'id': i, 'type': 'Run', 'start_date_local': '2025-01-01T07:00:00Z',
+                 'distance': 5000.0, 'gear_id': 'g1'} for i in ids]
+        return 200, body, rate_limit_headers()
+    return handler
+
+
+def test_short_first_page_is_the_only_request():
+    client, adapter = make_client(activity_pages(50))
+    
+    activities = client.get_activities_fast(limit=1000)
+    
+    assert [a.id for a in activities] == list(range(1, 51))
+    assert len(adapter.requests) == 1
+
+
+def test_full_first_page_fans_out_until_short_page():
+    client, adapter = make_client(activity_pages(450))
+    
+    activities = client.get_activities_fast(limit=450, max_workers=1)
+    
+    assert [a.id for a in activities] == list(range(1, 451))
+    assert len(adapter.requests) == 3
+
+
+def test_athlete_gear_defaults_missing_fields():
+    body = {'id': 1, 'shoes': [{'id': 'g1', 'name': 'Pegasus', 'distance': None, 'primary': None}]}
+    client, _ = make_client(lambda request: (200, body, rate_limit_headers()))
+    
+    assert client.get_athlete_gear() == [{'id': 'g1', 'name': 'Pegasus', 'distance': 0.0, 'primary': False}]